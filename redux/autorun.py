@@ -3,9 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import inspect
 import weakref
 from asyncio import Future, Task, iscoroutine, iscoroutinefunction
+from types import MethodType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -81,7 +81,7 @@ class Autorun(
         self._should_be_called = False
         if options.keep_ref:
             self._func = func
-        elif inspect.ismethod(func):
+        elif isinstance(func, MethodType):
             self._func = weakref.WeakMethod(func, self.unsubscribe)
         else:
             self._func = weakref.ref(func, self.unsubscribe)
@@ -92,6 +92,7 @@ class Autorun(
         )
         self._options = options
 
+        self._last_checked_state: State | None = None
         self._last_selector_result: SelectorOutput | None = None
         self._last_comparator_result: ComparatorOutput = cast(
             ComparatorOutput,
@@ -178,6 +179,10 @@ class Autorun(
     ) -> bool:
         if state is None:
             return False
+        # States are immutable, so checking the same state again can't change the
+        # selector and comparator results
+        if state is self._last_checked_state:
+            return self._should_be_called
         try:
             selector_result = self._selector(state)
         except AttributeError:
@@ -189,9 +194,11 @@ class Autorun(
                 comparator_result = self._comparator(state)
             except AttributeError:
                 return False
-        self._should_be_called = (
-            self._should_be_called or comparator_result != self._last_comparator_result
+        self._should_be_called = self._should_be_called or (
+            comparator_result is not self._last_comparator_result
+            and comparator_result != self._last_comparator_result
         )
+        self._last_checked_state = state
         self._last_selector_result = selector_result
         self._last_comparator_result = comparator_result
         return self._should_be_called
@@ -311,18 +318,19 @@ class Autorun(
             initial_run = self._options.subscribers_initial_run
         if keep_ref is None:
             keep_ref = self._options.subscribers_keep_ref
+
+        def unsubscribe(_: weakref.ref | None = None) -> None:
+            self._subscriptions.discard(callback_ref)
+
         if keep_ref:
             callback_ref = callback
-        elif inspect.ismethod(callback):
-            callback_ref = weakref.WeakMethod(callback)
+        elif isinstance(callback, MethodType):
+            callback_ref = weakref.WeakMethod(callback, unsubscribe)
         else:
-            callback_ref = weakref.ref(callback)
+            callback_ref = weakref.ref(callback, unsubscribe)
         self._subscriptions.add(callback_ref)
 
         if initial_run:
             callback(self.value)
 
-        def unsubscribe() -> None:
-            self._subscriptions.discard(callback_ref)
-
         return unsubscribe
@@ -124,6 +124,7 @@ class CreateStoreOptions(Immutable, Generic[Action, Event]):
     task_creator: TaskCreator | None = None
     on_finish: Callable[[], Any] | None = None
     grace_time_in_seconds: float = 1
+    batch_listener_notifications: bool = False
 
 
 # Autorun
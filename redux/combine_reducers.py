@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 import copy
-import functools
-import operator
 import uuid
 from dataclasses import asdict, fields
+from itertools import chain
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from immutable import make_immutable
@@ -26,6 +25,8 @@ from .basic_types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from redux import ReducerType
 
 
@@ -36,6 +37,46 @@ CombineReducerState = TypeVar(
 AnyAction = TypeVar('AnyAction', bound=BaseAction)
 
 
+_FACTORY_NAMES = frozenset(
+    {'__redux_self__', '__redux_class__', '__redux_new__', '__redux_setattr__'},
+)
+
+
+def _make_state_factory(
+    state_class: type,
+    keys: Iterable[str],
+) -> Callable[..., Any]:
+    keys = tuple(keys)
+    if _FACTORY_NAMES.intersection(keys):
+        # A key would shadow a name the generated code relies on, use the regular
+        # keyword constructor instead
+        def factory(_id: str, *values: Any) -> Any:  # noqa: ANN401
+            return state_class(_id=_id, **dict(zip(keys, values, strict=True)))
+
+        return factory
+
+    # `state_class` is keyword-only (as `dataclasses.replace` expects), generate a
+    # positional constructor for the hot path the same way `dataclasses` generates
+    # `__init__`, field names are guaranteed to be identifiers by `make_dataclass`
+    names = ('_id', *keys)
+    body = ''.join(
+        f'    __redux_setattr__(__redux_self__, {name!r}, {name})\n' for name in names
+    )
+    source = (
+        f'def factory({", ".join(names)}):\n'
+        '    __redux_self__ = __redux_new__(__redux_class__)\n'
+        f'{body}'
+        '    return __redux_self__\n'
+    )
+    namespace: dict[str, Any] = {
+        '__redux_class__': state_class,
+        '__redux_new__': object.__new__,
+        '__redux_setattr__': object.__setattr__,
+    }
+    exec(source, namespace)  # noqa: S102
+    return namespace['factory']
+
+
 def combine_reducers(
     state_type: type[CombineReducerState],
     action_type: type[Action] = BaseAction,
@@ -47,6 +88,7 @@ def combine_reducers(
     _id = uuid.uuid4().hex
 
     state_class = make_immutable(state_type.__name__, (('_id', str), *reducers.keys()))
+    state_factory = _make_state_factory(state_class, reducers)
 
     def combined_reducer(
         state: CombineReducerState | None,
@@ -54,7 +96,7 @@ def combine_reducers(
     ) -> CompleteReducerResult[CombineReducerState, Action, Event]:
         result_actions = []
         result_events = []
-        nonlocal state_class
+        nonlocal state_class, state_factory
         if (
             state is not None
             and isinstance(action, CombineReducerAction)
@@ -68,6 +110,7 @@ def combine_reducers(
                     state_type.__name__,
                     (('_id', str), *reducers.keys()),
                 )
+                state_factory = _make_state_factory(state_class, reducers)
                 reducer_result = reducer(
                     None,
                     CombineReducerInitAction(_id=_id, key=key, payload=action.payload),
@@ -107,6 +150,7 @@ def combine_reducers(
                 del annotations_copy[key]
                 state_class = make_immutable(state_type.__name__, annotations_copy)
                 cast(Any, state_class).__dataclass_fields__ = fields_copy
+                state_factory = _make_state_factory(state_class, reducers)
 
                 state = state_class(
                     **{
@@ -116,37 +160,26 @@ def combine_reducers(
                     },
                 )
 
-        reducers_results = {
-            key: reducer(
+        state_values: list[Any] = []
+        complete_results: list[CompleteReducerResult] = []
+        for key, reducer in reducers.items():
+            result = reducer(
                 None if state is None else getattr(state, key),
                 CombineReducerInitAction(key=key, _id=_id)
                 if isinstance(action, InitAction)
                 else action,
             )
-            for key, reducer in reducers.items()
-        }
-        result_state = state_class(
-            _id=_id,
-            **{
-                key: result.state if is_complete_reducer_result(result) else result
-                for key, result in reducers_results.items()
-            },
-        )
-        result_actions += functools.reduce(
-            operator.iadd,
-            [
-                result.actions or [] if is_complete_reducer_result(result) else []
-                for result in reducers_results.values()
-            ],
-            [],
+            if is_complete_reducer_result(result):
+                state_values.append(result.state)
+                complete_results.append(result)
+            else:
+                state_values.append(result)
+        result_state = state_factory(_id, *state_values)
+        result_actions.extend(
+            chain.from_iterable(result.actions or () for result in complete_results),
         )
-        result_events += functools.reduce(
-            operator.iadd,
-            [
-                result.events or [] if is_complete_reducer_result(result) else []
-                for result in reducers_results.values()
-            ],
-            [],
+        result_events.extend(
+            chain.from_iterable(result.events or () for result in complete_results),
         )
 
         return CompleteReducerResult(
@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
-import queue
+import time
 import weakref
-from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from threading import Lock, Thread
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from itertools import chain
+from threading import Condition, Lock, Thread
+from types import MethodType
 from typing import (
     Any,
     Concatenate,
     Generic,
+    TypeVar,
     cast,
     overload,
 )
@@ -55,10 +57,70 @@ from redux.basic_types import (
     ViewOriginalReturnType,
     ViewReturnType,
     is_complete_reducer_result,
-    is_state_reducer_result,
 )
 from redux.serialization_mixin import SerializationMixin
-from redux.side_effect_runner import SideEffectRunnerThread
+from redux.side_effect_runner import (
+    SideEffectRunnerThread,
+    TaskQueue,
+    count_parameters,
+)
+
+T = TypeVar('T')
+
+# Options are immutable, so the defaults are shared instead of being created per call
+_DEFAULT_CREATE_STORE_OPTIONS: CreateStoreOptions = CreateStoreOptions()
+_DEFAULT_AUTORUN_OPTIONS: AutorunOptions = AutorunOptions()
+_DEFAULT_VIEW_OPTIONS: ViewOptions = ViewOptions()
+
+
+def _compose_middlewares(
+    middlewares: Sequence[Callable[[T], T | None]],
+) -> Callable[[T], T | None]:
+    if len(middlewares) == 1:
+        return middlewares[0]
+    # Unroll the middleware chain into a single generated function so that
+    # dispatching an item doesn't iterate the middlewares list
+    body = ''.join(
+        f'    item = middleware_{index}(item)\n'
+        '    if item is None:\n'
+        '        return None\n'
+        for index in range(len(middlewares))
+    )
+    namespace: dict[str, Any] = {
+        f'middleware_{index}': middleware
+        for index, middleware in enumerate(middlewares)
+    }
+    exec(f'def pipeline(item):\n{body}    return item\n', namespace)  # noqa: S102
+    return namespace['pipeline']
+
+
+class _WeakCallable:
+    """Call a weakly referenced function or bound method if it is still alive."""
+
+    __slots__ = ('_ref',)
+
+    def __init__(
+        self: _WeakCallable,
+        func: Callable,
+        callback: Callable[[weakref.ref], Any],
+    ) -> None:
+        self._ref = (
+            weakref.WeakMethod(func, callback)
+            if isinstance(func, MethodType)
+            else weakref.ref(func, callback)
+        )
+
+    def __call__(self: _WeakCallable, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        func = self._ref()
+        if func is None:
+            return None
+        return func(*args, **kwargs)
+
+    def __eq__(self: _WeakCallable, other: object) -> bool:
+        return isinstance(other, _WeakCallable) and self._ref == other._ref
+
+    def __hash__(self: _WeakCallable) -> int:
+        return hash(self._ref)
 
 
 class Store(Generic[State, Action, Event], SerializationMixin):
@@ -70,36 +132,52 @@ class Store(Generic[State, Action, Event], SerializationMixin):
         options: CreateStoreOptions[Action, Event] | None = None,
     ) -> None:
         """Create a new store."""
-        self.store_options = options or CreateStoreOptions()
+        self.store_options = options or _DEFAULT_CREATE_STORE_OPTIONS
         self.reducer = reducer
         self._create_task = self.store_options.task_creator
 
-        self._action_middlewares = list(self.store_options.action_middlewares)
-        self._event_middlewares = list(self.store_options.event_middlewares)
+        self._action_middlewares = tuple(self.store_options.action_middlewares)
+        self._event_middlewares = tuple(self.store_options.event_middlewares)
+        self._rebuild_pipelines()
 
         self._state: State | None = None
-        self._listeners: set[
-            Callable[[State], Any] | weakref.ref[Callable[[State], Any]]
-        ] = set()
+        # Dicts are used as insertion-ordered sets, so listeners are called in the
+        # order they subscribed
+        self._listeners: dict[Callable[[State], Any], None] = {}
+        self._listeners_snapshot: tuple[Callable[[State], Any], ...] = ()
+        # Event handlers are mapped to the number of parameters they accept
         self._event_handlers: defaultdict[
             type[Event],
-            set[EventHandler | weakref.ref[EventHandler]],
-        ] = defaultdict(set)
+            dict[EventHandler | weakref.ref[EventHandler], int],
+        ] = defaultdict(dict)
+        self._event_handlers_snapshot: dict[
+            type[Event],
+            tuple[tuple[EventHandler | weakref.ref[EventHandler], int], ...],
+        ] = {}
 
-        self._actions: list[Action] = []
-        self._events: list[Event] = []
+        self._actions: deque[Action] = deque()
+        self._events: deque[Event] = deque()
 
-        self._event_handlers_queue = queue.Queue[
-            tuple[EventHandler[Event], Event] | None
+        self._event_handlers_queue = TaskQueue[
+            tuple[EventHandler[Event], int, Event] | None
         ]()
         self._workers = [
             SideEffectRunnerThread(task_queue=self._event_handlers_queue)
             for _ in range(self.store_options.threads)
         ]
-        for worker in self._workers:
-            worker.start()
+        self._workers_started = False
 
         self._is_running = Lock()
+        # Without a scheduler, dispatching runs the store right away
+        self._runs_on_dispatch = self.store_options.scheduler is None
+        self._is_state_dirty = False
+        self._notify_listeners = (
+            self._mark_state_dirty
+            if self.store_options.batch_listener_notifications
+            else self._call_listeners
+        )
+        self._is_finishing = False
+        self._idle_condition = Condition()
 
         self.subscribe_event(FinishEvent, self._handle_finish_event)
 
@@ -116,62 +194,97 @@ class Store(Generic[State, Action, Event], SerializationMixin):
             self.store_options.scheduler(self.run, interval=True)
 
     def _call_listeners(self: Store[State, Action, Event], state: State) -> None:
-        for listener_ in self._listeners.copy():
-            if isinstance(listener_, weakref.ref):
-                listener = listener_()
-                if listener is None:
-                    self._listeners.discard(listener_)
-                    continue
-            else:
-                listener = listener_
+        for listener in self._listeners_snapshot:
             result = listener(state)
-            if asyncio.iscoroutine(result) and self._create_task:
+            if result is not None and asyncio.iscoroutine(result) and self._create_task:
                 self._create_task(result)
 
-    def _run_actions(self: Store[State, Action, Event]) -> None:
-        while len(self._actions) > 0:
-            action = self._actions.pop(0)
-            if action is not None:
-                result = self.reducer(self._state, action)
-                if is_complete_reducer_result(result):
-                    self._state = result.state
-                    self._call_listeners(self._state)
-                    self._dispatch([*(result.actions or []), *(result.events or [])])
-                elif is_state_reducer_result(result):
-                    self._state = result
-                    self._call_listeners(self._state)
-
-                if isinstance(action, FinishAction):
-                    self._dispatch([cast(Event, FinishEvent())])
-
-    def _run_event_handlers(self: Store[State, Action, Event]) -> None:
-        while len(self._events) > 0:
-            event = self._events.pop(0)
-            if event is not None:
-                for event_handler in self._event_handlers[type(event)].copy():
-                    self._event_handlers_queue.put_nowait((event_handler, event))
+    def _mark_state_dirty(self: Store[State, Action, Event], _: State) -> None:
+        self._is_state_dirty = True
+
+    def _run_action(self: Store[State, Action, Event], action: Action) -> None:
+        if action is not None:
+            result = self.reducer(self._state, action)
+            if is_complete_reducer_result(result):
+                state = result.state
+                self._state = state
+                self._notify_listeners(state)
+                # `run` is already draining the queues, so follow-ups are only enqueued
+                if result.actions:
+                    self._enqueue(result.actions)
+                if result.events:
+                    self._enqueue(result.events)
+            else:
+                # Anything but a `CompleteReducerResult` is the new state itself
+                state = cast(State, result)
+                self._state = state
+                self._notify_listeners(state)
+
+            if isinstance(action, FinishAction):
+                self._enqueue((cast(Event, FinishEvent()),))
+
+    def _run_event_handlers(self: Store[State, Action, Event], event: Event) -> None:
+        if event is not None:
+            event_handlers = self._event_handlers_snapshot.get(type(event))
+            if event_handlers:
+                if not self._workers_started:
+                    self._start_workers()
+                self._event_handlers_queue.put_many(
+                    [
+                        (event_handler, parameters_count, event)
+                        for event_handler, parameters_count in event_handlers
+                    ],
+                )
+
+    def _start_workers(self: Store[State, Action, Event]) -> None:
+        # Side effect runner threads are only started once there is an event handler
+        # to run, so stores that never handle events don't spawn any threads
+        self._workers_started = True
+        for worker in self._workers:
+            worker.start()
 
     def run(self: Store[State, Action, Event]) -> None:
         """Run the store."""
-        with self._is_running:
-            while len(self._actions) > 0 or len(self._events) > 0:
-                if len(self._actions) > 0:
-                    self._run_actions()
+        # Re-entrant calls and calls while another thread is draining the queues
+        # return right away, the running loop picks up whatever they enqueued
+        if not self._is_running.acquire(blocking=False):
+            return
+        actions = self._actions
+        events = self._events
+        try:
+            while True:
+                if actions:
+                    self._run_action(actions.popleft())
+                elif self._is_state_dirty:
+                    # With batched notifications, listeners are called once with
+                    # the latest state after all queued actions are reduced
+                    self._is_state_dirty = False
+                    self._call_listeners(cast(State, self._state))
+                elif events:
+                    self._run_event_handlers(events.popleft())
+                else:
+                    break
+        finally:
+            self._is_running.release()
 
-                if len(self._events) > 0:
-                    self._run_event_handlers()
+        if self._is_finishing:
+            with self._idle_condition:
+                self._idle_condition.notify_all()
 
     def clean_up(self: Store[State, Action, Event]) -> None:
         """Clean up the store."""
         self.wait_for_event_handlers()
-        for _ in range(self.store_options.threads):
-            self._event_handlers_queue.put_nowait(None)
-        self.wait_for_event_handlers()
-        for worker in self._workers:
-            worker.join()
+        if self._workers_started:
+            for _ in self._workers:
+                self._event_handlers_queue.put_nowait(None)
+            self.wait_for_event_handlers()
+            for worker in self._workers:
+                worker.join()
         self._workers.clear()
         self._listeners.clear()
+        self._listeners_snapshot = ()
         self._event_handlers.clear()
+        self._event_handlers_snapshot.clear()
 
     def wait_for_event_handlers(self: Store[State, Action, Event]) -> None:
         """Wait for the event handlers to finish."""
@@ -196,40 +309,65 @@ class Store(Generic[State, Action, Event], SerializationMixin):
         """Dispatch actions."""
         if with_state is not None:
             self.dispatch(with_state(self._state))
+            if not parameters:
+                return
+
+        if len(parameters) == 1:
+            # A single action is dispatched through the `parameters` tuple itself
+            parameter = parameters[0]
+            self._dispatch(
+                parameter
+                if isinstance(parameter, list)
+                else cast(tuple[Action, ...], parameters),
+            )
+            return
 
-        actions = [
-            action
-            for actions in parameters
-            for action in (actions if isinstance(actions, list) else [actions])
-        ]
-        self._dispatch(actions)
+        # The flattening is lazy, items are classified and enqueued as they're produced
+        self._dispatch(
+            chain.from_iterable(
+                actions if isinstance(actions, list) else (actions,)
+                for actions in parameters
+            ),
+        )
 
     def _dispatch(
         self: Store[State, Action, Event],
-        items: list[Action | Event],
+        items: Iterable[Action | Event],
     ) -> None:
+        self._enqueue(items)
+
+        if self._runs_on_dispatch:
+            self.run()
+
+    def _enqueue_items(
+        self: Store[State, Action, Event],
+        items: Iterable[Action | Event],
+    ) -> None:
+        actions = self._actions
+        events = self._events
         for item in items:
             if isinstance(item, BaseAction):
-                action = cast(Action, item)
-                for action_middleware in self._action_middlewares:
-                    action_ = action_middleware(action)
-                    if action_ is None:
-                        break
-                    action = action_
-                else:
-                    self._actions.append(action)
+                actions.append(cast(Action, item))
             if isinstance(item, BaseEvent):
-                event = cast(Event, item)
-                for event_middleware in self._event_middlewares:
-                    event_ = event_middleware(event)
-                    if event_ is None:
-                        break
-                    event = event_
-                else:
-                    self._events.append(event)
+                events.append(cast(Event, item))
 
-        if self.store_options.scheduler is None and not self._is_running.locked():
-            self.run()
+    def _enqueue_items_through_pipelines(
+        self: Store[State, Action, Event],
+        items: Iterable[Action | Event],
+    ) -> None:
+        actions = self._actions
+        events = self._events
+        action_pipeline = self._action_pipeline
+        event_pipeline = self._event_pipeline
+        for item in items:
+            if isinstance(item, BaseAction):
+                action = action_pipeline(cast(Action, item))
+                if action is not None:
+                    actions.append(action)
+            if isinstance(item, BaseEvent):
+                event = event_pipeline(cast(Event, item))
+                if event is not None:
+                    events.append(event)
 
     def subscribe(
         self: Store[State, Action, Event],
@@ -238,15 +376,17 @@ class Store(Generic[State, Action, Event], SerializationMixin):
         keep_ref: bool = True,
     ) -> Callable[[], None]:
         """Subscribe to state changes."""
-        if keep_ref:
-            listener_ref = listener
-        elif inspect.ismethod(listener):
-            listener_ref = weakref.WeakMethod(listener)
-        else:
-            listener_ref = weakref.ref(listener)
 
-        self._listeners.add(listener_ref)
-        return lambda: self._listeners.remove(listener_ref)
+        def unsubscribe(_: weakref.ref | None = None) -> None:
+            self._listeners.pop(listener_ref, None)
+            self._listeners_snapshot = tuple(self._listeners)
+
+        listener_ref = listener if keep_ref else _WeakCallable(listener, unsubscribe)
+
+        self._listeners[listener_ref] = None
+        self._listeners_snapshot = tuple(self._listeners)
+
+        return unsubscribe
 
     def subscribe_event(
         self: Store[State, Action, Event],
@@ -256,38 +396,45 @@ class Store(Generic[State, Action, Event], SerializationMixin):
         keep_ref: bool = True,
     ) -> Callable[[], None]:
         """Subscribe to events."""
+        event_type_ = cast(Any, event_type)
+
+        def unsubscribe(_: weakref.ref | None = None) -> None:
+            self._event_handlers[event_type_].pop(handler_ref, None)
+            self._event_handlers_snapshot[event_type_] = tuple(
+                self._event_handlers[event_type_].items(),
+            )
+
         if keep_ref:
             handler_ref = handler
-        elif inspect.ismethod(handler):
-            handler_ref = weakref.WeakMethod(handler)
+        elif isinstance(handler, MethodType):
+            handler_ref = weakref.WeakMethod(handler, unsubscribe)
         else:
-            handler_ref = weakref.ref(handler)
+            handler_ref = weakref.ref(handler, unsubscribe)
 
-        self._event_handlers[cast(Any, event_type)].add(handler_ref)
-
-        def unsubscribe() -> None:
-            self._event_handlers[cast(Any, event_type)].discard(handler_ref)
+        self._event_handlers[event_type_][handler_ref] = count_parameters(handler)
+        self._event_handlers_snapshot[event_type_] = tuple(
+            self._event_handlers[event_type_].items(),
+        )
 
         return unsubscribe
 
     def _wait_for_store_to_finish(self: Store[State, Action, Event]) -> None:
         """Wait for the store to finish."""
-        import time
-
         while True:
-            if (
-                self._actions == []
-                and self._events == []
-                and self._event_handlers_queue.qsize() == 0
-            ):
-                time.sleep(self.store_options.grace_time_in_seconds)
-                self.clean_up()
-                if self.store_options.on_finish:
-                    self.store_options.on_finish()
-                break
-            time.sleep(0.1)
+            self._event_handlers_queue.join()
+            with self._idle_condition:
+                if not self._actions and not self._events:
+                    if self._event_handlers_queue.unfinished_tasks == 0:
+                        break
+                    continue
+                self._idle_condition.wait()
+        time.sleep(self.store_options.grace_time_in_seconds)
+        self.clean_up()
+        if self.store_options.on_finish:
+            self.store_options.on_finish()
 
     def _handle_finish_event(self: Store[State, Action, Event]) -> None:
+        self._is_finishing = True
         Thread(target=self._wait_for_store_to_finish).start()
 
     @overload
@@ -343,7 +490,7 @@ class Store(Generic[State, Action, Event], SerializationMixin):
                 selector=selector,
                 comparator=comparator,
                 func=cast(Callable, func),
-                options=options or AutorunOptions(),
+                options=options or _DEFAULT_AUTORUN_OPTIONS,
             )
 
         return decorator
@@ -394,7 +541,7 @@ class Store(Generic[State, Action, Event], SerializationMixin):
                 AwaitableOrNot[ViewOriginalReturnType],
             ],
         ) -> ViewReturnType[AwaitableOrNot[ViewOriginalReturnType], ViewArgs]:
-            _options = options or ViewOptions()
+            _options = options or _DEFAULT_VIEW_OPTIONS
             return Autorun(
                 store=self,
                 selector=selector,
@@ -418,30 +565,49 @@ class Store(Generic[State, Action, Event], SerializationMixin):
         """Return a snapshot of the current state of the store."""
         return self.serialize_value(self._state)
 
+    def _rebuild_pipelines(self: Store[State, Action, Event]) -> None:
+        self._action_pipeline = _compose_middlewares(self._action_middlewares)
+        self._event_pipeline = _compose_middlewares(self._event_middlewares)
+        # Without any middlewares, items are enqueued directly, skipping the calls
+        # to the (identity) pipelines
+        self._enqueue = (
+            self._enqueue_items_through_pipelines
+            if self._action_middlewares or self._event_middlewares
+            else self._enqueue_items
+        )
+
     def register_action_middleware(
         self: Store[State, Action, Event],
         action_middleware: ActionMiddleware,
     ) -> None:
         """Register an action dispatch middleware."""
-        self._action_middlewares.append(action_middleware)
+        self._action_middlewares = (*self._action_middlewares, action_middleware)
+        self._rebuild_pipelines()
 
     def register_event_middleware(
         self: Store[State, Action, Event],
         event_middleware: EventMiddleware,
     ) -> None:
         """Register an action dispatch middleware."""
-        self._event_middlewares.append(event_middleware)
+        self._event_middlewares = (*self._event_middlewares, event_middleware)
+        self._rebuild_pipelines()
 
     def unregister_action_middleware(
         self: Store[State, Action, Event],
         action_middleware: ActionMiddleware,
     ) -> None:
         """Unregister an action dispatch middleware."""
-        self._action_middlewares.remove(action_middleware)
+        action_middlewares = list(self._action_middlewares)
+        action_middlewares.remove(action_middleware)
+        self._action_middlewares = tuple(action_middlewares)
+        self._rebuild_pipelines()
 
     def unregister_event_middleware(
         self: Store[State, Action, Event],
         event_middleware: EventMiddleware,
     ) -> None:
         """Unregister an action dispatch middleware."""
-        self._event_middlewares.remove(event_middleware)
+        event_middlewares = list(self._event_middlewares)
+        event_middlewares.remove(event_middleware)
+        self._event_middlewares = tuple(event_middlewares)
+        self._rebuild_pipelines()
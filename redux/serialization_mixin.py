@@ -3,24 +3,40 @@
 from __future__ import annotations
 
 import dataclasses
+import weakref
 from types import NoneType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from immutable import Immutable, is_immutable
 
 if TYPE_CHECKING:
     from redux.basic_types import SnapshotAtom
 
+_PRIMITIVE_TYPES = frozenset({int, float, str, bool, NoneType})
+_SEQUENCE_TYPES = frozenset({list, tuple})
+_FIELD_NAMES: weakref.WeakKeyDictionary[type, tuple[str, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class SerializationMixin:
     """Mixin for serialization."""
 
+    __slots__ = ()
+
     @classmethod
     def serialize_value(
         cls: type[SerializationMixin],
         obj: object | type,
     ) -> SnapshotAtom:
         """Serialize a value to a snapshot atom."""
+        # Exact type lookups cover most of the values in a state tree, anything else,
+        # including subclasses of these types, goes through the generic checks below
+        obj_type = type(obj)
+        if obj_type in _PRIMITIVE_TYPES:
+            return cast('SnapshotAtom', obj)
+        if obj_type in _SEQUENCE_TYPES:
+            return [cls.serialize_value(i) for i in cast('list | tuple', obj)]
         if isinstance(obj, int | float | str | bool | NoneType):
             return obj
         if callable(obj):
@@ -37,8 +53,15 @@ class SerializationMixin:
         cls: type[SerializationMixin],
         obj: Immutable,
     ) -> dict[str, Any]:
-        result: dict[str, object] = {'_type': obj.__class__.__name__}
-        for field in dataclasses.fields(obj):
-            value = cls.serialize_value(getattr(obj, field.name))
-            result[field.name] = value
+        obj_type = type(obj)
+        try:
+            field_names = _FIELD_NAMES[obj_type]
+        except KeyError:
+            field_names = _FIELD_NAMES[obj_type] = tuple(
+                field.name for field in dataclasses.fields(obj)
+            )
+        result: dict[str, object] = {'_type': obj_type.__name__}
+        for field_name in field_names:
+            value = cls.serialize_value(getattr(obj, field_name))
+            result[field_name] = value
         return result
@@ -7,14 +7,74 @@ import contextlib
 import threading
 import weakref
 from asyncio import Handle, iscoroutine
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Sequence
 from inspect import signature
-from typing import TYPE_CHECKING, Any, Generic, cast
+from typing import Any, Generic, TypeVar, cast
 
 from redux.basic_types import Event, EventHandler
 
-if TYPE_CHECKING:
-    import queue
+T = TypeVar('T')
+
+
+def count_parameters(func: Callable) -> int:
+    """Return the number of parameters `func` accepts, defaulting to 1."""
+    parameters = 1
+    with contextlib.suppress(Exception):
+        parameters = len(signature(func).parameters)
+    return parameters
+
+
+class TaskQueue(Generic[T]):
+    """Unbounded FIFO queue feeding side effect runner threads.
+
+    It provides the subset of `queue.Queue` the store needs (`put_nowait`, `get`,
+    `task_done` and `join`) on top of a bare `deque` guarded by a single mutex,
+    skipping the capacity bookkeeping of `queue.Queue`, plus `put_many` to enqueue
+    a batch of tasks under one lock acquisition.
+    """
+
+    def __init__(self: TaskQueue) -> None:
+        """Initialize the task queue."""
+        self._items: deque[T] = deque()
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self.unfinished_tasks = 0
+
+    def put_nowait(self: TaskQueue[T], item: T) -> None:
+        """Put an item into the queue."""
+        with self._mutex:
+            self._items.append(item)
+            self.unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def put_many(self: TaskQueue[T], items: Sequence[T]) -> None:
+        """Put several items into the queue at once."""
+        with self._mutex:
+            self._items.extend(items)
+            self.unfinished_tasks += len(items)
+            self._not_empty.notify(len(items))
+
+    def get(self: TaskQueue[T]) -> T:
+        """Remove and return an item from the queue, blocking until one exists."""
+        with self._not_empty:
+            while not self._items:
+                self._not_empty.wait()
+            return self._items.popleft()
+
+    def task_done(self: TaskQueue[T]) -> None:
+        """Indicate that a formerly enqueued task is complete."""
+        with self._all_tasks_done:
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self: TaskQueue[T]) -> None:
+        """Block until all items in the queue have been processed."""
+        with self._all_tasks_done:
+            while self.unfinished_tasks:
+                self._all_tasks_done.wait()
 
 
 class SideEffectRunnerThread(threading.Thread, Generic[Event]):
@@ -23,7 +83,7 @@ class SideEffectRunnerThread(threading.Thread, Generic[Event]):
     def __init__(
         self: SideEffectRunnerThread,
         *,
-        task_queue: queue.Queue[tuple[EventHandler[Event], Event] | None],
+        task_queue: TaskQueue[tuple[EventHandler[Event], int, Event] | None],
     ) -> None:
         """Initialize the side effect runner thread."""
         super().__init__()
@@ -42,21 +102,18 @@ class SideEffectRunnerThread(threading.Thread, Generic[Event]):
                 self.task_queue.task_done()
                 break
             try:
-                event_handler_, event = task
+                event_handler_, parameters_count, event = task
                 if isinstance(event_handler_, weakref.ref):
                     event_handler = event_handler_()
                     if event_handler is None:
                         continue
                 else:
                     event_handler = event_handler_
-                parameters = 1
-                with contextlib.suppress(Exception):
-                    parameters = len(signature(event_handler).parameters)
-                if parameters == 1:
+                if parameters_count == 1:
                     result = cast(Callable[[Event], Any], event_handler)(event)
                 else:
                     result = cast(Callable[[], Any], event_handler)()
-                if iscoroutine(result):
+                if result is not None and iscoroutine(result):
                     self.create_task(result)
             finally:
                 self.task_queue.task_done()
@@ -119,6 +119,27 @@ def test_with_comparator(
         return value
 
 
+def test_selector_runs_once_per_state(store: StoreType) -> None:
+    selector_calls = []
+
+    def selector(state: StateType) -> int:
+        selector_calls.append(state.value)
+        return state.value
+
+    @store.autorun(selector, options=AutorunOptions(reactive=False))
+    def decorated(value: int) -> int:
+        return value
+
+    assert decorated() == 0
+    assert decorated() == 0
+    assert selector_calls == [0]
+
+    store.dispatch(IncrementAction())
+    assert decorated() == 1
+    assert decorated() == 1
+    assert selector_calls == [0, 1]
+
+
 def test_value_property(store_snapshot: StoreSnapshot, store: StoreType) -> None:
     @store.autorun(lambda state: state.value)
     def render(value: int) -> int:
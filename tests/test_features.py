@@ -226,3 +226,62 @@ def test_general(
     # Finish
     # ------
     store.dispatch(FinishAction())
+
+
+def test_batch_listener_notifications(reducer: Reducer) -> None:
+    store = Store(
+        reducer[0],
+        CreateStoreOptions(auto_init=True, batch_listener_notifications=True),
+    )
+    counts = []
+    store.subscribe(lambda state: counts.append(state.straight.count))
+
+    store.dispatch(IncrementAction(), IncrementAction(), IncrementAction())
+    store.dispatch([IncrementAction(), DecrementByTwoAction()])
+
+    assert counts == [3, 2]
+
+
+def test_listeners_are_called_in_subscription_order(reducer: Reducer) -> None:
+    store = Store(reducer[0], CreateStoreOptions(auto_init=True))
+    calls = []
+    for index in range(5):
+        store.subscribe(lambda _, index=index: calls.append(index))
+
+    store.dispatch(IncrementAction())
+
+    assert calls == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    'key',
+    ['self', 'factory', '__redux_self__', '__redux_class__'],
+)
+def test_combine_reducers_with_reserved_key(key: str) -> None:
+    reducers: dict[str, ReducerType] = {key: straight_reducer, 'base10': base10_reducer}
+    reducer, reducer_id = combine_reducers(
+        BaseCombineReducerState,
+        BaseAction,
+        BaseEvent,
+        **reducers,
+    )
+    store = Store(reducer, CreateStoreOptions(auto_init=True))
+
+    store.dispatch(IncrementAction())
+    assert getattr(store._state, key) == CountStateType(count=1)  # noqa: SLF001
+
+    store.dispatch(
+        CombineReducerRegisterAction(
+            _id=reducer_id,
+            key='inverse',
+            reducer=inverse_reducer,
+        ),
+        IncrementAction(),
+    )
+    assert getattr(store._state, key) == CountStateType(count=2)  # noqa: SLF001
+    assert getattr(store._state, 'inverse') == CountStateType(count=-1)  # noqa: B009, SLF001
+
+    store.dispatch(CombineReducerUnregisterAction(_id=reducer_id, key='base10'))
+    store.dispatch(IncrementAction())
+    assert getattr(store._state, key) == CountStateType(count=3)  # noqa: SLF001
+    assert not hasattr(store._state, 'base10')  # noqa: SLF001
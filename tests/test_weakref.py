@@ -352,3 +352,29 @@ def test_event_subscription_method(
         method.assert_called_once_with(DummyEvent())
 
     subscriptions_ran()
+
+
+def test_dead_subscriptions_are_purged(
+    store_snapshot: StoreSnapshot,
+    store: StoreType,
+) -> None:
+    def subscription(_: StateType) -> None:
+        pytest.fail('This should never be called')
+
+    def event_subscription(_: DummyEvent) -> None:
+        pytest.fail('This should never be called')
+
+    instance = SubscriptionClass(store_snapshot)
+
+    store.subscribe(subscription, keep_ref=False)
+    store.subscribe(instance.method_without_keep_ref, keep_ref=False)
+    store.subscribe_event(DummyEvent, event_subscription, keep_ref=False)
+    assert len(store._listeners) == 2  # noqa: SLF001
+    assert len(store._event_handlers[DummyEvent]) == 1  # noqa: SLF001
+
+    del subscription, event_subscription, instance
+
+    assert store._listeners == {}  # noqa: SLF001
+    assert store._listeners_snapshot == ()  # noqa: SLF001
+    assert store._event_handlers[DummyEvent] == {}  # noqa: SLF001
+    assert store._event_handlers_snapshot[DummyEvent] == ()  # noqa: SLF001